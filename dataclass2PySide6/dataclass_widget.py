@@ -1,5 +1,6 @@
 import dataclasses
-from PySide6.QtCore import Signal, QSignalBlocker
+import weakref
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QWidget,
     QGroupBox,
@@ -8,9 +9,21 @@ from PySide6.QtWidgets import (
     QTabWidget,
     QSizePolicy,
 )
-from typing import Dict, Optional, get_type_hints, Any, Type, TypeVar, Union, cast
+from typing import (
+    Dict,
+    Optional,
+    get_type_hints,
+    Any,
+    Type,
+    TypeVar,
+    Union,
+    Tuple,
+    NamedTuple,
+    Callable,
+    cast,
+)
 
-from .datawidgets import type2Widget
+from .datawidgets import type2Widget, _BatchEmitMixin
 from .typing import DataclassProtocol, DataWidgetProtocol
 
 
@@ -30,10 +43,51 @@ class _DefaultDataclass:
     pass
 
 
+class _FieldSchema(NamedTuple):
+    """Field of dataclass with the information to construct its widget."""
+
+    field: dataclasses.Field
+    typehint: Any
+    fromQt_converter: Optional[Callable[[Any], Any]]
+    toQt_converter: Optional[Callable[[Any], Any]]
+
+
+_SCHEMA_CACHE: "weakref.WeakKeyDictionary[type, Tuple[_FieldSchema, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _dataclassSchema(datacls: Type[DataclassProtocol]) -> Tuple[_FieldSchema, ...]:
+    """
+    Return the schema of the fields of *datacls*.
+
+    ``Qt_typehint`` metadata of the field has priority over the
+    annotation. Result is cached, so that the type hints and metadata of
+    a dataclass are resolved only once. Cache does not keep the
+    dataclass alive.
+    """
+    schema = _SCHEMA_CACHE.get(datacls)
+    if schema is not None:
+        return schema
+    annots = get_type_hints(datacls.__init__)
+    ret = []
+    for f in dataclasses.fields(datacls):
+        if "Qt_typehint" in f.metadata:
+            typehint = f.metadata["Qt_typehint"]
+        else:
+            typehint = annots[f.name]
+        fromQt = f.metadata.get("fromQt_converter", None)
+        toQt = f.metadata.get("toQt_converter", None)
+        ret.append(_FieldSchema(f, typehint, fromQt, toQt))
+    schema = tuple(ret)
+    _SCHEMA_CACHE[datacls] = schema
+    return schema
+
+
 T = TypeVar("T", bound="DataclassWidget")
 
 
-class DataclassWidget(QGroupBox):
+class DataclassWidget(_BatchEmitMixin, QGroupBox):
     """
     Widget for a dataclass type. Subwidgets represent the fields of the
     dataclass.
@@ -105,15 +159,10 @@ class DataclassWidget(QGroupBox):
         """
         obj = cls()
         obj._dataclass_type = datacls
-        fields = dataclasses.fields(datacls)
-        annots = get_type_hints(datacls.__init__)
+        schema = _dataclassSchema(datacls)
 
         widgets = {}
-        for f in fields:
-            if "Qt_typehint" in f.metadata:
-                typehint = f.metadata["Qt_typehint"]
-            else:
-                typehint = annots[f.name]
+        for f, typehint, _, _ in schema:
             w = obj.field2Widget(typehint, f)
             widgets[f.name] = w
         obj._widgets = widgets
@@ -138,7 +187,7 @@ class DataclassWidget(QGroupBox):
         widget.setDataName(field.name)
 
         default = field.default
-        if default != dataclasses.MISSING:
+        if default is not dataclasses.MISSING:
             widget.setDataValue(default)  # type: ignore
 
         return widget
@@ -172,6 +221,8 @@ class DataclassWidget(QGroupBox):
         self.setLayout(layout)
 
     def emitDataValueChanged(self):
+        if self._deferEmission():
+            return
         try:
             val = self.dataValue()
             self.dataValueChanged.emit(val)
@@ -188,15 +239,15 @@ class DataclassWidget(QGroupBox):
         field.
 
         """
-        widgets = self.widgets()
         dcls = self.dataclassType()
+        widgets = self.widgets()
         args = {}
-        for f in dataclasses.fields(dcls):
-            val = widgets[f.name].dataValue()
-            converter = f.metadata.get("fromQt_converter", None)
+        for f, _, converter, _ in _dataclassSchema(dcls):
+            name = f.name
+            val = widgets[name].dataValue()
             if converter is not None:
                 val = converter(val)
-            args[f.name] = val
+            args[name] = val
         data = dcls(**args)
         return data
 
@@ -208,20 +259,25 @@ class DataclassWidget(QGroupBox):
         metadata whose value is a unary function which takes the field
         value. Its return value is updated to the subwidget.
 
+        Subwidgets are updated in :meth:`batch`, so the dataclass
+        instance is constructed and emitted only once.
+
         """
         widgets = self.widgets()
-        dcls = self.dataclassType()
-
-        with QSignalBlocker(self):
-            for f in dataclasses.fields(dcls):
-                val = getattr(data, f.name)
-                converter = f.metadata.get("toQt_converter", None)
+        with self.batch():
+            for f, _, _, converter in _dataclassSchema(self.dataclassType()):
+                name = f.name
+                val = getattr(data, name)
                 if converter is not None:
                     val = converter(val)
+                widgets[name].setDataValue(val)
+            self.emitDataValueChanged()
 
-                w = widgets[f.name]
-                w.setDataValue(val)
-        self.emitDataValueChanged()
+
+# size policies to make the stacked/tabbed widgets ignore the size of
+# hidden pages
+_IGNORED_POLICY = QSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+_PREFERRED_POLICY = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
 
 
 class StackedDataclassWidget(QStackedWidget):
@@ -260,19 +316,22 @@ class StackedDataclassWidget(QStackedWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._dataclass_index: Dict[type, int] = {}
+        self.widgetAdded.connect(self._clearDataclassIndex)
+        self.widgetRemoved.connect(self._clearDataclassIndex)
 
     def addWidget(self, w: QWidget):
         # force size policy to make ignore the size of hidden widget
-        w.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        w.setSizePolicy(_IGNORED_POLICY)
         super().addWidget(w)
 
     def setCurrentIndex(self, index: int):
         old_widget = self.currentWidget()
         if old_widget is not None:
-            old_widget.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+            old_widget.setSizePolicy(_IGNORED_POLICY)
         new_widget = self.widget(index)
         if new_widget is not None:
-            new_widget.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+            new_widget.setSizePolicy(_PREFERRED_POLICY)
             new_widget.adjustSize()
         super().setCurrentIndex(index)
         self.adjustSize()
@@ -280,9 +339,9 @@ class StackedDataclassWidget(QStackedWidget):
     def setCurrentWidget(self, w: QWidget):
         old_widget = self.currentWidget()
         if old_widget is not None:
-            old_widget.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+            old_widget.setSizePolicy(_IGNORED_POLICY)
         if w is not None:
-            w.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+            w.setSizePolicy(_PREFERRED_POLICY)
             w.adjustSize()
         super().setCurrentWidget(w)
         self.adjustSize()
@@ -300,7 +359,14 @@ class StackedDataclassWidget(QStackedWidget):
         """
         Returns the index of the widget for *dcls*. If not found, return
         -1.
+
+        Index is recorded for each dataclass, until the widgets are
+        inserted, removed or moved.
         """
+        index = self._dataclass_index.get(dcls)
+        if index is not None:
+            return index
+
         ret = -1
         for i in range(self.count()):
             widget = self.widget(i)
@@ -309,8 +375,13 @@ class StackedDataclassWidget(QStackedWidget):
                 if widget_dcls is dcls:
                     ret = i
                     break
+        if ret != -1:
+            self._dataclass_index[dcls] = ret
         return ret
 
+    def _clearDataclassIndex(self, *args):
+        self._dataclass_index.clear()
+
     def emitDataValueChanged(self, data: DataclassProtocol):
         if self.indexOfDataclass(type(data)) == self.currentIndex():
             try:
@@ -361,19 +432,29 @@ class TabDataclassWidget(QTabWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._dataclass_index: Dict[type, int] = {}
+        self.tabBar().tabMoved.connect(self._clearDataclassIndex)
 
     def addTab(self, widget: QWidget, *args):
         # force size policy to make ignore the size of hidden widget
-        widget.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        widget.setSizePolicy(_IGNORED_POLICY)
         super().addTab(widget, *args)
 
+    def tabInserted(self, index: int):
+        super().tabInserted(index)
+        self._clearDataclassIndex()
+
+    def tabRemoved(self, index: int):
+        super().tabRemoved(index)
+        self._clearDataclassIndex()
+
     def setCurrentIndex(self, index: int):
         old_widget = self.currentWidget()
         if old_widget is not None:
-            old_widget.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+            old_widget.setSizePolicy(_IGNORED_POLICY)
         new_widget = self.widget(index)
         if new_widget is not None:
-            new_widget.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+            new_widget.setSizePolicy(_PREFERRED_POLICY)
             new_widget.adjustSize()
         super().setCurrentIndex(index)
         self.adjustSize()
@@ -381,9 +462,9 @@ class TabDataclassWidget(QTabWidget):
     def setCurrentWidget(self, w: QWidget):
         old_widget = self.currentWidget()
         if old_widget is not None:
-            old_widget.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+            old_widget.setSizePolicy(_IGNORED_POLICY)
         if w is not None:
-            w.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+            w.setSizePolicy(_PREFERRED_POLICY)
             w.adjustSize()
         super().setCurrentWidget(w)
         self.adjustSize()
@@ -398,7 +479,14 @@ class TabDataclassWidget(QTabWidget):
         """
         Returns the index of the widget for *dcls*. If not found, return
         -1.
+
+        Index is recorded for each dataclass, until the widgets are
+        inserted, removed or moved.
         """
+        index = self._dataclass_index.get(dcls)
+        if index is not None:
+            return index
+
         ret = -1
         for i in range(self.count()):
             widget = self.widget(i)
@@ -407,8 +495,13 @@ class TabDataclassWidget(QTabWidget):
                 if widget_dcls is dcls:
                     ret = i
                     break
+        if ret != -1:
+            self._dataclass_index[dcls] = ret
         return ret
 
+    def _clearDataclassIndex(self, *args):
+        self._dataclass_index.clear()
+
     def emitDataValueChanged(self, data: DataclassProtocol):
         if self.indexOfDataclass(type(data)) == self.currentIndex():
             try:
@@ -10,8 +10,11 @@ Every widget has following methods and attributes:
 * ``setDataValue()``: Set the current state of the widget
 
 """
+from contextlib import contextmanager
 from enum import Enum
-from PySide6.QtCore import Signal, Qt
+import functools
+import weakref
+from PySide6.QtCore import Signal, Qt, QTimer
 from PySide6.QtGui import QValidator, QIntValidator, QDoubleValidator
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -20,7 +23,20 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
 )
-from typing import List, Union, Any, Type, Optional, TypeVar
+from typing import (
+    List,
+    Tuple,
+    Dict,
+    Union,
+    Any,
+    Type,
+    Optional,
+    TypeVar,
+    Iterator,
+    Callable,
+    get_origin,
+    get_args,
+)
 from .typing import DataWidgetProtocol
 
 
@@ -39,42 +55,100 @@ __all__ = [
 
 
 def type2Widget(t: Any) -> DataWidgetProtocol:
-    """Return the widget instance for given type annotation."""
+    """
+    Return the widget instance for given type annotation.
+
+    The function which constructs the widget is cached for each hashable
+    annotation.
+    """
+    return _resolveWidgetFactory(t)()
+
+
+def _resolveWidgetFactory(t: Any) -> Callable[[], DataWidgetProtocol]:
+    try:
+        hash(t)
+    except TypeError:
+        return _widgetFactory.__wrapped__(t)
+    return _widgetFactory(t)
+
+
+@functools.lru_cache(maxsize=256)
+def _widgetFactory(t: Any) -> Callable[[], DataWidgetProtocol]:
+    """Return the function which constructs the widget for *t*."""
     if isinstance(t, type) and issubclass(t, Enum):
-        return EnumComboBox.fromEnum(t)
+        return functools.partial(EnumComboBox.fromEnum, t)
     if isinstance(t, type) and issubclass(t, bool):
-        return BoolCheckBox()
+        return BoolCheckBox
     if isinstance(t, type) and issubclass(t, int):
-        return IntLineEdit()
+        return IntLineEdit
     if isinstance(t, type) and issubclass(t, float):
-        return FloatLineEdit()
+        return FloatLineEdit
     if isinstance(t, type) and issubclass(t, str):
-        return StrLineEdit()
-    origin = getattr(t, "__origin__", None)  # t is Tuple[]
-    if origin is tuple:
-        args = getattr(t, "__args__", None)
-        if args is None:
-            raise TypeError("%s does not have argument type" % t)
-        if Ellipsis in args:
-            txt = "Number of arguments of %s not fixed" % t
-            raise TypeError(txt)
-        widgets = [type2Widget(arg) for arg in args]
-        return TupleGroupBox.fromWidgets(widgets)
-    if origin is Union:
-        args = [a for a in getattr(t, "__args__") if not isinstance(None, a)]
-        if len(args) > 1:
-            msg = f"Cannot convert Union with multiple types: {t}"
-            raise TypeError(msg)
-        widget = type2Widget(args[0])
-        if isinstance(widget, BoolCheckBox):
-            widget.setTristate(True)
-            return widget
-        if isinstance(widget, (IntLineEdit, FloatLineEdit)):
-            widget.setDefaultDataValue(None)
-            return widget
+        return StrLineEdit
+    build = _ORIGIN_DISPATCH.get(get_origin(t))
+    if build is not None:
+        return build(t)
+    raise TypeError("Unknown type or annotation: %s" % t)
+
+
+def _tupleFactory(t: Any) -> Callable[[], DataWidgetProtocol]:
+    args = get_args(t)
+    if not args:
+        raise TypeError("%s does not have argument type" % t)
+    if Ellipsis in args:
+        txt = "Number of arguments of %s not fixed" % t
+        raise TypeError(txt)
+    factories = tuple(_resolveWidgetFactory(arg) for arg in args)
+    return functools.partial(_tupleGroupBox, factories)
+
+
+def _unionFactory(t: Any) -> Callable[[], DataWidgetProtocol]:
+    args = tuple(a for a in get_args(t) if a is not type(None))
+    if len(args) > 1:
+        msg = f"Cannot convert Union with multiple types: {t}"
+        raise TypeError(msg)
+    arg = args[0] if args else None
+    if not isinstance(arg, type) or issubclass(arg, Enum):
+        raise TypeError("Unknown type or annotation: %s" % t)
+    if issubclass(arg, bool):
+        return _tristateCheckBox
+    if issubclass(arg, int):
+        return functools.partial(_optionalLineEdit, IntLineEdit)
+    if issubclass(arg, float):
+        return functools.partial(_optionalLineEdit, FloatLineEdit)
     raise TypeError("Unknown type or annotation: %s" % t)
 
 
+_ORIGIN_DISPATCH: Dict[Any, Callable[[Any], Callable[[], DataWidgetProtocol]]] = {
+    tuple: _tupleFactory,
+    Union: _unionFactory,
+}
+
+
+def _tupleGroupBox(
+    factories: Tuple[Callable[[], DataWidgetProtocol], ...]
+) -> "TupleGroupBox":
+    return TupleGroupBox.fromWidgets([factory() for factory in factories])
+
+
+def _tristateCheckBox() -> "BoolCheckBox":
+    widget = BoolCheckBox()
+    widget.setTristate(True)
+    return widget
+
+
+def _optionalLineEdit(
+    cls: Union[Type["IntLineEdit"], Type["FloatLineEdit"]]
+) -> Union["IntLineEdit", "FloatLineEdit"]:
+    widget = cls()
+    widget.setDefaultDataValue(None)
+    return widget
+
+
+_CHECK_STATE_TO_BOOL = {Qt.Checked: True, Qt.Unchecked: False}
+_BOOL_TO_CHECK_STATE = {True: Qt.Checked, False: Qt.Unchecked}
+
+
 class BoolCheckBox(QCheckBox):
     """
     Checkbox for fuzzy boolean value. If tristate is allowed, boolean
@@ -109,6 +183,7 @@ class BoolCheckBox(QCheckBox):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._emit_changed = self.dataValueChanged.emit
 
         self.stateChanged.connect(self.emitDataValueChanged)
 
@@ -120,32 +195,17 @@ class BoolCheckBox(QCheckBox):
         self.setToolTip(name)
 
     def dataValue(self) -> Optional[bool]:
-        checkstate = self.checkState()
-        if checkstate == Qt.Checked:
-            state = True
-        elif checkstate == Qt.Unchecked:
-            state = False
-        else:
-            state = None
-        return state
+        return _CHECK_STATE_TO_BOOL.get(self.checkState())
 
     def setDataValue(self, value: Union[bool, None]):
-        if value is True:
-            state = Qt.Checked
-        elif value is False:
-            state = Qt.Unchecked
-        else:
-            state = Qt.PartiallyChecked
-        self.setCheckState(state)
-
-    def emitDataValueChanged(self, checkstate: Qt.CheckState):
-        if checkstate == Qt.Checked:
-            state = True
-        elif checkstate == Qt.Unchecked:
-            state = False
-        else:
-            state = None
-        self.dataValueChanged.emit(state)
+        state = _BOOL_TO_CHECK_STATE.get(value, Qt.PartiallyChecked)  # type: ignore
+        if state != self.checkState():
+            self.setCheckState(state)  # type: ignore
+
+    def emitDataValueChanged(self, checkstate: Union[Qt.CheckState, int]):
+        # stateChanged may pass the state as int
+        state = _CHECK_STATE_TO_BOOL.get(Qt.CheckState(checkstate))
+        self._emit_changed(state)
 
 
 class _MISSING_TYPE:
@@ -157,53 +217,57 @@ class _MISSING_TYPE:
 MISSING = _MISSING_TYPE()
 
 
+@functools.lru_cache(maxsize=None)
+def _sharedValidator(cls: Type[QValidator]) -> QValidator:
+    """Return the validator of *cls* which is shared by the line edits."""
+    return cls()
+
+
+@functools.lru_cache(maxsize=64)
+def _textToInt(text: str) -> int:
+    return int(text)
+
+
+@functools.lru_cache(maxsize=64)
+def _textToFloat(text: str) -> float:
+    return float(text)
+
+
 class EmptyIntValidator(QIntValidator):
     """Validator which accpets integer and empty string"""
 
     def validate(self, input: str, pos: int) -> QValidator.State:
-        ret: QValidator.State = super().validate(input, pos)  # type: ignore
         if not input:
-            ret = QValidator.Acceptable
-        return ret
+            return QValidator.Acceptable
+        return super().validate(input, pos)  # type: ignore
 
 
-class IntLineEdit(QLineEdit):
+class _NumberLineEdit(QLineEdit):
     """
-    Line edit for integer value.
-
-    :meth:`dataValue` returns the value from current text. If the text
-    is empty, return the default value if exists.
+    Base class for the line edits of numeric value.
 
-    When editing is finished, :attr:`dataValueChanged` signal is
-    emitted. :meth:`setDataValue` changes the text and emits the signal.
-
-    Examples
-    ========
-
-    >>> from PySide6.QtWidgets import QApplication
-    >>> import sys
-    >>> from dataclass2PySide6 import IntLineEdit
-    >>> def runGUI():
-    ...     app = QApplication(sys.argv)
-    ...     widget = IntLineEdit()
-    ...     widget.show()
-    ...     app.exec()
-    ...     app.quit()
-    >>> runGUI() # doctest: +SKIP
+    Subclass defines the text parser, the value formatter and the
+    validators.
     """
 
     dataValueChanged = Signal(object)
 
+    _textToValue: Callable[[str], Any]
+    _valueToText: Callable[[Any], str]
+    _validator_type: type
+    _empty_validator_type: type
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._emit_changed = self.dataValueChanged.emit
+        self._last_value: Any = MISSING
 
-        self._int_validator = QIntValidator(self)
-        self._emptyint_validator = EmptyIntValidator(self)
-
-        self.setValidator(self._int_validator)
         self.setDefaultDataValue(MISSING)
 
-        self.editingFinished.connect(self.emitDataValueChanged)
+        # created by setEmitDebounceMs() when debouncing is enabled
+        self._emit_timer: Optional[QTimer] = None
+
+        self.editingFinished.connect(self._onEditingFinished)
 
     def dataName(self) -> str:
         """
@@ -223,7 +287,7 @@ class IntLineEdit(QLineEdit):
         """
         Convert the text to data value.
 
-        If the text is not empty, convert it to ``int`` and return.
+        If the text is not empty, convert it to the number and return.
 
         If the text is empty but the widget has default data value,
         return the default value. If the text is empty and there is no
@@ -235,14 +299,22 @@ class IntLineEdit(QLineEdit):
         hasDefaultDataValue, defaultDataValue
 
         """
-        if text:
-            val = int(text)
-        elif self.hasDefaultDataValue():
-            val = self.defaultDataValue()
-        else:
+        return self._value_from_text(text)
+
+    def _makeValueFromText(self) -> Callable[[str], Any]:
+        """Build the text converter specialized to the default value."""
+        parse = self._textToValue
+        if self.hasDefaultDataValue():
+            default = self._default_data_value
+            return lambda text: parse(text) if text else default
+
+        def valueFromText(text: str) -> Any:
+            if text:
+                return parse(text)
             name = self.dataName() or str(self)
             raise TypeError("Missing data for %s" % name)
-        return val
+
+        return valueFromText
 
     def defaultDataValue(self) -> Any:
         """
@@ -259,15 +331,18 @@ class IntLineEdit(QLineEdit):
 
         If ``MISSING`` is passed, it is interpreted as no default value.
 
-        If default value exists, :class:`EmptyIntValidator` is set as
-        validator. If not, ``QIntValidator`` is set as validator.
+        If default value exists, the validator which accepts empty
+        string is set. If not, the plain numeric validator is set.
+        The validator is shared by every line edit of the same class
+        and replaces the one set by ``setValidator()``.
 
         """
         self._default_data_value = val
+        self._value_from_text = self._makeValueFromText()
         if self.hasDefaultDataValue():
-            self.setValidator(self._emptyint_validator)
+            self.setValidator(_sharedValidator(self._empty_validator_type))
         else:
-            self.setValidator(self._int_validator)
+            self.setValidator(_sharedValidator(self._validator_type))
 
     def hasDefaultDataValue(self) -> bool:
         """
@@ -276,7 +351,7 @@ class IntLineEdit(QLineEdit):
         If :meth:`defaultDataValue` returns ``MISSING``, return
         ``False``. Else, return ``True``.
         """
-        return self.defaultDataValue() is not MISSING
+        return self._default_data_value is not MISSING
 
     def dataValue(self) -> Any:
         """
@@ -294,11 +369,14 @@ class IntLineEdit(QLineEdit):
         valid, emit to :attr:`dataValueChanged`.
 
         If the new value is same as the default value, empty str is set.
+        Text is not updated if it is already identical.
         """
-        if value == self.defaultDataValue():
-            self.setText("")
+        if value == self._default_data_value:
+            text = ""
         else:
-            self.setText(str(value))
+            text = self._valueToText(value)
+        if text != self.text():
+            self.setText(text)
         self.emitDataValueChanged()
 
     def emitDataValueChanged(self):
@@ -308,165 +386,139 @@ class IntLineEdit(QLineEdit):
         """
         try:
             val = self.dataValue()
-            self.dataValueChanged.emit(val)
         except TypeError:
-            pass
-
-
-class EmptyFloatValidator(QDoubleValidator):
-    """Validator which accpets float and empty string"""
+            return
+        self._last_value = val
+        self._emit_changed(val)
 
-    def validate(self, input: str, pos: int) -> QValidator.State:
-        ret: QValidator.State = super().validate(input, pos)  # type: ignore
-        if not input:
-            ret = QValidator.Acceptable
-        return ret
+    def _emitIfChanged(self):
+        try:
+            val = self.dataValue()
+        except TypeError:
+            return
+        if val == self._last_value:
+            return
+        self._last_value = val
+        self._emit_changed(val)
+
+    def emitDebounceMs(self) -> int:
+        """
+        Delay in milliseconds to coalesce the emissions triggered by
+        finished editing. ``0`` means no debouncing.
+        """
+        timer = self._emit_timer
+        if timer is None:
+            return 0
+        return timer.interval()
+
+    def setEmitDebounceMs(self, ms: int):
+        """
+        Set the delay in milliseconds to coalesce the emissions of
+        :attr:`dataValueChanged` triggered by finished editing.
+
+        If *ms* is positive, rapid edits are collected and the signal is
+        emitted once after the delay. If ``0``, the signal is emitted
+        immediately.
+        """
+        timer = self._emit_timer
+        if timer is None:
+            if ms <= 0:
+                return
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(self._emitIfChanged)
+            self._emit_timer = timer
+        timer.setInterval(ms)
+
+    def _onEditingFinished(self):
+        timer = self._emit_timer
+        if timer is not None and timer.interval() > 0:
+            timer.start()
+        else:
+            self._emitIfChanged()
 
 
-class FloatLineEdit(QLineEdit):
+class IntLineEdit(_NumberLineEdit):
     """
-    Line edit for float value.
+    Line edit for integer value.
 
     :meth:`dataValue` returns the value from current text. If the text
     is empty, return the default value if exists.
 
-    When editing is finished, :attr:`dataValueChanged` signal is
-    emitted. :meth:`setDataValue` changes the text and emits the signal.
+    When editing is finished with the value different from the last
+    emitted one, :attr:`dataValueChanged` signal is emitted.
+    :meth:`setDataValue` changes the text and always emits the signal.
+
+    If default value exists, :class:`EmptyIntValidator` is set as
+    validator. If not, ``QIntValidator`` is set as validator. These
+    validators are shared by all line edits, so ``validator()`` must
+    not be modified; use ``setValidator()`` to set a different one.
 
     Examples
     ========
 
     >>> from PySide6.QtWidgets import QApplication
     >>> import sys
-    >>> from dataclass2PySide6 import FloatLineEdit
+    >>> from dataclass2PySide6 import IntLineEdit
     >>> def runGUI():
     ...     app = QApplication(sys.argv)
-    ...     widget = FloatLineEdit()
+    ...     widget = IntLineEdit()
     ...     widget.show()
     ...     app.exec()
     ...     app.quit()
     >>> runGUI() # doctest: +SKIP
     """
 
-    dataValueChanged = Signal(object)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-
-        self._float_validator = QDoubleValidator(self)
-        self._emptyfloat_validator = EmptyFloatValidator(self)
-
-        self.setValidator(self._float_validator)
-        self.setDefaultDataValue(MISSING)
-
-        self.editingFinished.connect(self.emitDataValueChanged)
-
-    def dataName(self) -> str:
-        """
-        Name of the data field, which is displayed as placeholder text.
-        """
-        return self.placeholderText()
-
-    def setDataName(self, name: str):
-        """
-        Set the name of the data field. The name is displayed as
-        placeholder text and tooltip.
-        """
-        self.setPlaceholderText(name)
-        self.setToolTip(name)
-
-    def valueFromText(self, text: str) -> Any:
-        """
-        Convert the text to data value.
-
-        If the text is not empty, convert it to ``float`` and return.
-
-        If the text is empty but the widget has default data value,
-        return the default value. If the text is empty and there is no
-        default data value, raise ``TypeError``.
-
-        See Also
-        ========
-
-        hasDefaultDataValue, defaultDataValue
-
-        """
-        if text:
-            val = float(text)
-        elif self.hasDefaultDataValue():
-            val = self.defaultDataValue()
-        else:
-            name = self.dataName() or str(self)
-            raise TypeError("Missing data for %s" % name)
-        return val
-
-    def defaultDataValue(self) -> Any:
-        """
-        Default value for empty text.
+    _textToValue = staticmethod(_textToInt)
+    _valueToText = staticmethod(str)
+    _validator_type = QIntValidator
+    _empty_validator_type = EmptyIntValidator
 
-        If line edit is empty, this value is used as data instead.
-        ``MISSING`` indicates no default value.
-        """
-        return self._default_data_value
-
-    def setDefaultDataValue(self, val: Any):
-        """
-        Set the default value for empty text.
 
-        If ``MISSING`` is passed, it is interpreted as no default value.
+class EmptyFloatValidator(QDoubleValidator):
+    """Validator which accpets float and empty string"""
 
-        If default value exists, :class:`EmptyFloatValidator` is set as
-        validator. If not, ``QDoubleValidator`` is set as validator.
+    def validate(self, input: str, pos: int) -> QValidator.State:
+        if not input:
+            return QValidator.Acceptable
+        return super().validate(input, pos)  # type: ignore
 
-        """
-        self._default_data_value = val
-        if self.hasDefaultDataValue():
-            self.setValidator(self._emptyfloat_validator)
-        else:
-            self.setValidator(self._float_validator)
 
-    def hasDefaultDataValue(self) -> bool:
-        """
-        Returns whether the widget has default data value.
+class FloatLineEdit(_NumberLineEdit):
+    """
+    Line edit for float value.
 
-        If :meth:`defaultDataValue` returns ``MISSING``, return
-        ``False``. Else, return ``True``.
-        """
-        return self.defaultDataValue() is not MISSING
+    :meth:`dataValue` returns the value from current text. If the text
+    is empty, return the default value if exists.
 
-    def dataValue(self) -> Any:
-        """
-        Return the value from current text.
+    When editing is finished with the value different from the last
+    emitted one, :attr:`dataValueChanged` signal is emitted.
+    :meth:`setDataValue` changes the text and always emits the signal.
 
-        Text is converted to value using :meth:`valueFromText`.
-        """
-        text = self.text()
-        val = self.valueFromText(text)
-        return val
+    If default value exists, :class:`EmptyFloatValidator` is set as
+    validator. If not, ``QDoubleValidator`` is set as validator. These
+    validators are shared by all line edits, so ``validator()`` must
+    not be modified; use ``setValidator()`` to set a different one.
 
-    def setDataValue(self, value: Any):
-        """
-        Set current data value and update the text. If the value is
-        valid, emit to :attr:`dataValueChanged`.
+    Examples
+    ========
 
-        If the new value is same as the default value, empty str is set.
-        """
-        if value == self.defaultDataValue():
-            self.setText("")
-        else:
-            self.setText(str(value))
-        self.emitDataValueChanged()
+    >>> from PySide6.QtWidgets import QApplication
+    >>> import sys
+    >>> from dataclass2PySide6 import FloatLineEdit
+    >>> def runGUI():
+    ...     app = QApplication(sys.argv)
+    ...     widget = FloatLineEdit()
+    ...     widget.show()
+    ...     app.exec()
+    ...     app.quit()
+    >>> runGUI() # doctest: +SKIP
+    """
 
-    def emitDataValueChanged(self):
-        """
-        If current :meth:`dataValue` exists, emit it to
-        :attr:`dataValueChanged`.
-        """
-        try:
-            val = self.dataValue()
-            self.dataValueChanged.emit(val)
-        except TypeError:
-            pass
+    _textToValue = staticmethod(_textToFloat)
+    _valueToText = staticmethod(str)
+    _validator_type = QDoubleValidator
+    _empty_validator_type = EmptyFloatValidator
 
 
 class StrLineEdit(QLineEdit):
@@ -499,6 +551,7 @@ class StrLineEdit(QLineEdit):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._emit_changed = self.dataValueChanged.emit
 
         self.editingFinished.connect(self.emitDataValueChanged)
 
@@ -513,17 +566,67 @@ class StrLineEdit(QLineEdit):
         return self.text()
 
     def setDataValue(self, value: str):
-        self.setText(str(value))
+        text = str(value)
+        if text != self.text():
+            self.setText(text)
         self.emitDataValueChanged()
 
     def emitDataValueChanged(self):
-        self.dataValueChanged.emit(self.text())
+        self._emit_changed(self.text())
+
+
+class _BatchEmitMixin:
+    """
+    Mixin which provides :meth:`batch` to the container widgets.
+
+    ``emitDataValueChanged()`` of the subclass must return early if
+    :meth:`_deferEmission` returns ``True``.
+    """
+
+    _batch_depth = 0
+    _batch_pending = False
+
+    emitDataValueChanged: Callable[[], None]
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Context manager to suppress :attr:`dataValueChanged` while
+        subwidgets are updated.
+
+        Emissions requested inside the block are collected and the
+        signal is emitted once when the outermost block exits. If the
+        block raises, the collected emission is discarded.
+        """
+        if self._batch_depth == 0:
+            self._batch_pending = False
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._batch_pending = False
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batch_pending:
+            self._batch_pending = False
+            self.emitDataValueChanged()
+
+    def _deferEmission(self) -> bool:
+        """
+        If inside :meth:`batch` block, record the emission request and
+        return ``True``.
+        """
+        if self._batch_depth > 0:
+            self._batch_pending = True
+            return True
+        return False
 
 
 T = TypeVar("T", bound="TupleGroupBox")
 
 
-class TupleGroupBox(QGroupBox):
+class TupleGroupBox(_BatchEmitMixin, QGroupBox):
     """
     Widget to represent the tuple data with fixed number of items.
 
@@ -569,6 +672,8 @@ class TupleGroupBox(QGroupBox):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._widgets = []
+        self._cached_value: tuple = ()
+        self._cache_valid = False
 
     def dataName(self) -> str:
         return self.title()
@@ -581,34 +686,87 @@ class TupleGroupBox(QGroupBox):
         return self._widgets
 
     def initWidgets(self):
+        slot = self.emitDataValueChanged
         for widget in self.widgets():
-            widget.dataValueChanged.connect(self.emitDataValueChanged)
+            widget.dataValueChanged.connect(slot)
 
     def initUI(self):
         layout = QHBoxLayout()
+        add = layout.addWidget
         for widget in self.widgets():
-            layout.addWidget(widget)
+            add(widget)
         self.setLayout(layout)
 
     def dataValue(self) -> tuple:
-        return tuple(widget.dataValue() for widget in self.widgets())
+        """
+        Return the tuple of the data values of subwidgets.
+
+        While :attr:`dataValueChanged` is being emitted, the emitted
+        value is returned without reading the subwidgets again.
+        """
+        if self._cache_valid:
+            return self._cached_value
+        return tuple([widget.dataValue() for widget in self.widgets()])
 
     def setDataValue(self, value: tuple):
-        for w, v in zip(self.widgets(), value):
-            w.setDataValue(v)
-        self.emitDataValueChanged()
+        """
+        Set the items of *value* to the subwidgets and emit
+        :attr:`dataValueChanged` once.
+
+        Raise ``ValueError`` if the length of *value* is different from
+        the number of subwidgets. No subwidget is changed in that case.
+        """
+        widgets = self.widgets()
+        if len(value) != len(widgets):
+            msg = "Expected %s items, got %s" % (len(widgets), len(value))
+            raise ValueError(msg)
+        self._cache_valid = False
+        with self.batch():
+            for w, v in zip(widgets, value):
+                w.setDataValue(v)
+            self.emitDataValueChanged()
 
     def emitDataValueChanged(self):
+        # slot of previous emission may have changed the subwidgets
+        self._cache_valid = False
+        if self._deferEmission():
+            return
         try:
             value = self.dataValue()
-            self.dataValueChanged.emit(value)
         except (ValueError, TypeError):
-            pass
+            return
+        self._cached_value = value
+        self._cache_valid = True
+        try:
+            self.dataValueChanged.emit(value)
+        finally:
+            self._cache_valid = False
 
 
 V = TypeVar("V", bound="EnumComboBox")
 
 
+_ENUM_INDEX_CACHE: "weakref.WeakKeyDictionary[Type[Enum], Dict[str, int]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _enumIndices(enum: Type[Enum]) -> Dict[str, int]:
+    """
+    Return the mapping from the member names of *enum* to their indices.
+
+    The indices are valid for the items added by
+    :meth:`EnumComboBox.fromEnum`, until the items are changed. Cache
+    does not keep the enum alive; the mapping is keyed by names since
+    members refer to their enum.
+    """
+    indices = _ENUM_INDEX_CACHE.get(enum)
+    if indices is None:
+        indices = {e.name: i for i, e in enumerate(enum)}
+        _ENUM_INDEX_CACHE[enum] = indices
+    return indices
+
+
 class EnumComboBox(QComboBox):
     """
     Combo box for enum type.
@@ -655,11 +813,13 @@ class EnumComboBox(QComboBox):
         obj = cls()
         for e in enum:
             obj.addItem(e.name, userData=e)
+        obj._index_by_name = _enumIndices(enum)
         obj.setCurrentIndex(-1)
         return obj
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._index_by_name: Dict[str, int] = {}
 
         self.currentIndexChanged.connect(self.emitDataValueChanged)
 
@@ -677,7 +837,10 @@ class EnumComboBox(QComboBox):
         return self.itemData(index)
 
     def setDataValue(self, value: Enum):
-        index = self.findData(value)
+        # recorded index is outdated if the items are changed
+        index = self._index_by_name.get(getattr(value, "name", ""), -1)
+        if index == -1 or self.itemData(index) is not value:
+            index = self.findData(value)
         self.setCurrentIndex(index)
 
     def emitDataValueChanged(self, index: int):
@@ -1,8 +1,10 @@
 import dataclasses
 from enum import Enum
+import gc
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QSizePolicy
 import pytest
+import weakref
 from dataclass2PySide6 import (
     DataclassWidget,
     StackedDataclassWidget,
@@ -250,8 +252,11 @@ def test_DataclassWidget_setDataValue(qtbot, dclswidget):
         my_enum1=MyEnum.y,
     )
 
+    emitted = []
+    dclswidget.dataValueChanged.connect(emitted.append)
     dclswidget.setDataValue(dc)
     assert dclswidget.dataValue() == dc
+    assert emitted == [dc]
 
 
 def test_nested_DataclassWidget_setDataValue(qtbot, nested_dcw):
@@ -262,8 +267,64 @@ def test_nested_DataclassWidget_setDataValue(qtbot, nested_dcw):
     dcls1 = widget_dcls1.dataclassType()
 
     dc = dcls3(a=True, b=dcls2(x=-1, y=dcls1(z=100)))
+    emitted = []
+    nested_dcw.dataValueChanged.connect(emitted.append)
     nested_dcw.setDataValue(dc)
     assert nested_dcw.dataValue() == dc
+    assert emitted == [dc]
+
+
+def test_DataclassWidget_replaced_widget(qtbot):
+    @dataclasses.dataclass
+    class DataClass:
+        x: int
+
+    class MyDataclassWidget(DataclassWidget):
+        def initWidgets(self):
+            widget = IntLineEdit()
+            widget.setDataName("x")
+            self.widgets()["x"] = widget
+            super().initWidgets()
+
+    widget = MyDataclassWidget.fromDataclass(DataClass)
+    widget.setDataValue(DataClass(1))
+    assert widget.widgets()["x"].text() == "1"
+    widget.widgets()["x"].setDataValue(2)
+    assert widget.dataValue() == DataClass(2)
+
+
+def test_DataclassWidget_setDataValue_raises(qtbot):
+    @dataclasses.dataclass
+    class DataClass:
+        a: int
+        t: Tuple[int, int]
+
+    widget = DataclassWidget.fromDataclass(DataClass)
+    widget.setDataValue(DataClass(1, (2, 3)))
+
+    emitted = []
+    widget.dataValueChanged.connect(emitted.append)
+    with pytest.raises(ValueError):
+        widget.setDataValue(DataClass(5, (1, 2, 3)))
+    assert emitted == []
+
+    widget.setDataValue(DataClass(4, (5, 6)))
+    assert emitted == [DataClass(4, (5, 6))]
+
+
+def test_DataclassWidget_dataclass_not_retained(qtbot):
+    @dataclasses.dataclass
+    class DataClass:
+        x: int
+
+    widget = DataclassWidget.fromDataclass(DataClass)
+    DataclassWidget.fromDataclass(DataClass).deleteLater()
+    ref = weakref.ref(DataClass)
+    widget.deleteLater()
+    del widget, DataClass
+    qtbot.wait(10)
+    gc.collect()
+    assert ref() is None
 
 
 def test_DataclassWidget_str_annotation(qtbot):
@@ -332,6 +393,16 @@ def test_StackedDataclassWidget(qtbot, stackedwidget):
     assert stackedwidget.indexOfDataclass(Dataclass3) == 2
     assert stackedwidget.indexOfDataclass(OtherDataclass) == -1
 
+    # index is updated when the page is removed
+    stackedwidget.removeWidget(stackedwidget.widget(0))
+    assert stackedwidget.indexOfDataclass(Dataclass1) == -1
+    assert stackedwidget.indexOfDataclass(Dataclass3) == 1
+
+    # index is updated when the page is inserted before the recorded one
+    stackedwidget.insertWidget(0, DataclassWidget.fromDataclass(Dataclass3))
+    stackedwidget.insertWidget(0, DataclassWidget.fromDataclass(Dataclass3))
+    assert stackedwidget.indexOfDataclass(Dataclass3) == 0
+
 
 def test_StackedDataclassWidget_dataValueChanged(qtbot, stackedwidget):
 
@@ -474,6 +545,21 @@ def test_TabdataclassWidget(qtbot, tabwidget):
     assert tabwidget.indexOfDataclass(Dataclass3) == 2
     assert tabwidget.indexOfDataclass(OtherDataclass) == -1
 
+    # index is updated when the page is removed
+    tabwidget.removeTab(0)
+    assert tabwidget.indexOfDataclass(Dataclass1) == -1
+    assert tabwidget.indexOfDataclass(Dataclass3) == 1
+
+    # index is updated when the page is inserted before the recorded one
+    tabwidget.insertTab(0, DataclassWidget.fromDataclass(Dataclass3), "qux")
+    tabwidget.insertTab(0, DataclassWidget.fromDataclass(Dataclass3), "qux")
+    assert tabwidget.indexOfDataclass(Dataclass3) == 0
+    assert tabwidget.indexOfDataclass(Dataclass2) == 2
+
+    # index is updated when the page is moved
+    tabwidget.tabBar().moveTab(2, 0)
+    assert tabwidget.indexOfDataclass(Dataclass2) == 0
+
 
 def test_TabdataclassWidget_dataValueChanged(qtbot, tabwidget):
 
@@ -1,6 +1,10 @@
 from enum import Enum, IntEnum
-from PySide6.QtCore import Qt
+import gc
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QValidator, QIntValidator, QDoubleValidator
+from PySide6.QtWidgets import QVBoxLayout
 import pytest
+import weakref
 from dataclass2PySide6 import (
     type2Widget,
     BoolCheckBox,
@@ -10,16 +14,27 @@ from dataclass2PySide6 import (
     TupleGroupBox,
     EnumComboBox,
     MISSING,
+    EmptyIntValidator,
+    EmptyFloatValidator,
 )
-from typing import Tuple, Union, Optional
+from dataclass2PySide6.datawidgets import _widgetFactory
+from typing import Tuple, Union, Optional, Annotated
+
+
+@pytest.mark.parametrize(
+    "typehint, widget_cls",
+    [
+        (bool, BoolCheckBox),
+        (int, IntLineEdit),
+        (float, FloatLineEdit),
+        (str, StrLineEdit),
+    ],
+)
+def test_type2Widget_scalar(qtbot, typehint, widget_cls):
+    assert isinstance(type2Widget(typehint), widget_cls)
 
 
 def test_type2Widget(qtbot):
-    assert isinstance(type2Widget(bool), BoolCheckBox)
-    assert isinstance(type2Widget(int), IntLineEdit)
-    assert isinstance(type2Widget(float), FloatLineEdit)
-    assert isinstance(type2Widget(str), StrLineEdit)
-
     with pytest.raises(TypeError):
         type2Widget(Tuple)
     with pytest.raises(TypeError):
@@ -34,6 +49,11 @@ def test_type2Widget(qtbot):
     assert isinstance(tuplegbox2.widgets()[1], TupleGroupBox)
     assert isinstance(tuplegbox2.widgets()[1].widgets()[0], IntLineEdit)
 
+    tuplegbox3 = type2Widget(tuple[int, float])
+    assert isinstance(tuplegbox3, TupleGroupBox)
+    assert isinstance(tuplegbox3.widgets()[0], IntLineEdit)
+    assert isinstance(tuplegbox3.widgets()[1], FloatLineEdit)
+
 
 def test_type2Widget_Union(qtbot):
     with pytest.raises(TypeError):
@@ -51,6 +71,24 @@ def test_type2Widget_Union(qtbot):
     assert isinstance(optfloat_checkbox, FloatLineEdit)
     assert optfloat_checkbox.defaultDataValue() is None
 
+    optint_checkbox2 = type2Widget(Optional[int])
+    assert optint_checkbox2 is not optint_checkbox
+    assert optint_checkbox2.defaultDataValue() is None
+
+    with pytest.raises(TypeError):
+        type2Widget(Optional[str])
+
+
+def test_type2Widget_cache(qtbot):
+    _widgetFactory.cache_clear()
+    widget1 = type2Widget(Tuple[int, Optional[bool]])
+    widget2 = type2Widget(Tuple[int, Optional[bool]])
+    assert widget1 is not widget2
+    assert widget2.widgets()[1].isTristate()
+
+    with pytest.raises(TypeError, match="Unknown type"):
+        type2Widget(Annotated[int, []])
+
 
 def test_BoolCheckBox(qtbot):
     widget = BoolCheckBox()
@@ -81,6 +119,21 @@ def test_BoolCheckBox(qtbot):
         widget.setCheckState(Qt.PartiallyChecked)
 
 
+@pytest.mark.parametrize(
+    "validator_cls, base_cls",
+    [(EmptyIntValidator, QIntValidator), (EmptyFloatValidator, QDoubleValidator)],
+)
+def test_EmptyValidator(qtbot, monkeypatch, validator_cls, base_cls):
+    validator = validator_cls()
+    assert validator.validate("", 0) == QValidator.Acceptable
+
+    def fail(self, input, pos):
+        raise AssertionError("super().validate() called on empty input")
+
+    monkeypatch.setattr(base_cls, "validate", fail)
+    assert validator.validate("", 0) == QValidator.Acceptable
+
+
 def test_IntLineEdit(qtbot):
     widget = IntLineEdit()
 
@@ -115,8 +168,7 @@ def test_IntLineEdit(qtbot):
     with qtbot.waitSignal(
         widget.dataValueChanged, raising=True, check_params_cb=lambda val: val == -1
     ):
-        qtbot.keyPress(widget, "-")
-        qtbot.keyPress(widget, "1")
+        qtbot.keyClicks(widget, "-1")
         qtbot.keyPress(widget, Qt.Key_Return)
     assert widget.dataValue() == -1
 
@@ -144,13 +196,62 @@ def test_IntLineEdit(qtbot):
     with qtbot.waitSignal(
         widget.dataValueChanged, raising=True, check_params_cb=lambda val: val == 11
     ):
-        qtbot.keyPress(widget, "1")
-        qtbot.keyPress(widget, ".")  # this key is ignored
-        qtbot.keyPress(widget, "1")
+        qtbot.keyClicks(widget, "1.1")  # "." is ignored
         qtbot.keyPress(widget, Qt.Key_Return)
     assert widget.dataValue() == 11
 
 
+def test_IntLineEdit_debounce(qtbot):
+    widget = IntLineEdit()
+    assert widget.emitDebounceMs() == 0
+    assert not widget.findChildren(QTimer)
+
+    widget.setEmitDebounceMs(50)
+    assert widget.emitDebounceMs() == 50
+    emitted = []
+    widget.dataValueChanged.connect(emitted.append)
+    with qtbot.waitSignal(
+        widget.dataValueChanged, raising=True, check_params_cb=lambda val: val == 12
+    ):
+        qtbot.keyPress(widget, "1")
+        qtbot.keyPress(widget, Qt.Key_Return)
+        qtbot.keyPress(widget, "2")
+        qtbot.keyPress(widget, Qt.Key_Return)
+        assert not emitted
+    assert emitted == [12]
+
+
+@pytest.mark.parametrize("widget_cls", [IntLineEdit, FloatLineEdit])
+def test_NumberLineEdit_unchanged_value(qtbot, widget_cls):
+    widget = widget_cls()
+    emitted = []
+    widget.dataValueChanged.connect(emitted.append)
+    qtbot.keyPress(widget, "1")
+    qtbot.keyPress(widget, Qt.Key_Return)
+    qtbot.keyPress(widget, Qt.Key_Return)
+    assert emitted == [1]
+
+    widget.setDataValue(1)
+    assert emitted == [1, 1]
+
+
+def test_LineEdit_shared_validator(qtbot):
+    assert IntLineEdit().validator() is IntLineEdit().validator()
+    assert FloatLineEdit().validator() is FloatLineEdit().validator()
+
+    widget1, widget2 = IntLineEdit(), IntLineEdit()
+    widget1.setDefaultDataValue(None)
+    assert widget1.validator() is not widget2.validator()
+    widget2.setDefaultDataValue(None)
+    assert widget1.validator() is widget2.validator()
+
+    # own validator does not affect other widgets
+    validator = QIntValidator(0, 5, widget1)
+    widget1.setValidator(validator)
+    assert widget1.validator() is validator
+    assert widget2.validator() is not validator
+
+
 def test_FloatLineEdit(qtbot):
     widget = FloatLineEdit()
 
@@ -177,9 +278,7 @@ def test_FloatLineEdit(qtbot):
     with qtbot.waitSignal(
         widget.dataValueChanged, raising=True, check_params_cb=lambda val: val == 1.2
     ):
-        qtbot.keyPress(widget, "1")
-        qtbot.keyPress(widget, ".")
-        qtbot.keyPress(widget, "2")
+        qtbot.keyClicks(widget, "1.2")
         qtbot.keyPress(widget, Qt.Key_Return)
     assert widget.dataValue() == 1.2
 
@@ -187,10 +286,7 @@ def test_FloatLineEdit(qtbot):
     with qtbot.waitSignal(
         widget.dataValueChanged, raising=True, check_params_cb=lambda val: val == -1.2
     ):
-        qtbot.keyPress(widget, "-")
-        qtbot.keyPress(widget, "1")
-        qtbot.keyPress(widget, ".")
-        qtbot.keyPress(widget, "2")
+        qtbot.keyClicks(widget, "-1.2")
         qtbot.keyPress(widget, Qt.Key_Return)
     assert widget.dataValue() == -1.2
 
@@ -220,15 +316,23 @@ def test_FloatLineEdit(qtbot):
     with qtbot.waitSignal(
         widget.dataValueChanged, raising=True, check_params_cb=lambda val: val == 1.2
     ):
-        qtbot.mouseClick(widget, Qt.LeftButton)
-        qtbot.keyPress(widget, "1")
-        qtbot.keyPress(widget, ".")
-        qtbot.keyPress(widget, ".")  # this key is ignored
-        qtbot.keyPress(widget, "2")
+        qtbot.keyClicks(widget, "1..2")  # second "." is ignored
         qtbot.keyPress(widget, Qt.Key_Return)
     assert widget.dataValue() == 1.2
 
 
+@pytest.mark.parametrize(
+    "widget_cls, value",
+    [(IntLineEdit, 3), (FloatLineEdit, 1.5), (StrLineEdit, "foo")],
+)
+def test_LineEdit_setDataValue_emits_once(qtbot, widget_cls, value):
+    widget = widget_cls()
+    emitted = []
+    widget.dataValueChanged.connect(emitted.append)
+    widget.setDataValue(value)
+    assert emitted == [value]
+
+
 def test_StrLineEdit(qtbot):
     widget = StrLineEdit()
 
@@ -236,9 +340,7 @@ def test_StrLineEdit(qtbot):
     with qtbot.waitSignal(
         widget.dataValueChanged, raising=True, check_params_cb=lambda val: val == "foo"
     ):
-        qtbot.keyPress(widget, "f")
-        qtbot.keyPress(widget, "o")
-        qtbot.keyPress(widget, "o")
+        qtbot.keyClicks(widget, "foo")
         qtbot.keyPress(widget, Qt.Key_Return)
     assert widget.dataValue() == "foo"
     with qtbot.waitSignal(
@@ -248,6 +350,13 @@ def test_StrLineEdit(qtbot):
         qtbot.keyPress(widget, Qt.Key_Return)
     assert widget.dataValue() == ""
 
+    # setting identical value does not reset the text
+    widget.setDataValue("bar")
+    widget.setCursorPosition(0)
+    with qtbot.waitSignal(widget.dataValueChanged, raising=True):
+        widget.setDataValue("bar")
+    assert widget.cursorPosition() == 0
+
 
 def test_TupleGroupBox(qtbot):
     widgets = [IntLineEdit(), FloatLineEdit()]
@@ -269,6 +378,114 @@ def test_TupleGroupBox(qtbot):
     assert widget.dataValue() == (42, 0.0)
 
 
+def test_TupleGroupBox_setDataValue(qtbot):
+    widgets = [IntLineEdit(), IntLineEdit(), IntLineEdit()]
+    widget = TupleGroupBox.fromWidgets(widgets)
+
+    with qtbot.waitSignal(
+        widget.dataValueChanged,
+        raising=True,
+        check_params_cb=lambda val: val == (1, 2, 3),
+    ):
+        widget.setDataValue((1, 2, 3))
+    assert [w.text() for w in widgets] == ["1", "2", "3"]
+
+    emitted = []
+    widget.dataValueChanged.connect(emitted.append)
+    with pytest.raises(ValueError):
+        widget.setDataValue((1, 2))
+    assert [w.text() for w in widgets] == ["1", "2", "3"]
+    assert emitted == []
+
+
+def test_TupleGroupBox_batch(qtbot):
+    widgets = [IntLineEdit(), IntLineEdit()]
+    widget = TupleGroupBox.fromWidgets(widgets)
+
+    emitted = []
+    widget.dataValueChanged.connect(emitted.append)
+    widget.setDataValue((1, 2))
+    assert emitted == [(1, 2)]
+
+    emitted.clear()
+    with widget.batch():
+        with widget.batch():
+            widgets[0].setDataValue(3)
+        assert not emitted
+        widgets[1].setDataValue(4)
+        assert not emitted
+    assert emitted == [(3, 4)]
+
+
+def test_TupleGroupBox_batch_raises(qtbot):
+    widgets = [IntLineEdit(), IntLineEdit()]
+    widget = TupleGroupBox.fromWidgets(widgets)
+
+    emitted = []
+    widget.dataValueChanged.connect(emitted.append)
+    with pytest.raises(RuntimeError):
+        with widget.batch():
+            widgets[0].setDataValue(1)
+            widgets[1].setDataValue(2)
+            raise RuntimeError
+    assert emitted == []
+
+    widget.setDataValue((3, 4))
+    assert emitted == [(3, 4)]
+
+
+def test_TupleGroupBox_dataValue_cache(qtbot):
+    widgets = [IntLineEdit(), IntLineEdit()]
+    widget = TupleGroupBox.fromWidgets(widgets)
+    widget.setDataValue((1, 2))
+
+    reads = []
+    widget.dataValueChanged.connect(lambda val: reads.append(widget.dataValue()))
+    widgets[0].setDataValue(3)
+    assert reads == [(3, 2)]
+
+    # value is not cached outside of the emission
+    widgets[1].setText("")
+    with pytest.raises(TypeError):
+        widget.dataValue()
+
+
+def test_TupleGroupBox_reentrant_slot(qtbot):
+    widgets = [IntLineEdit(), IntLineEdit()]
+    widget = TupleGroupBox.fromWidgets(widgets)
+
+    emitted = []
+
+    def clamp(value):
+        emitted.append(value)
+        if value[0] > 10:
+            widget.setDataValue((10, value[1]))
+
+    widget.dataValueChanged.connect(clamp)
+    widget.setDataValue((50, 2))
+    assert emitted == [(50, 2), (10, 2)]
+    assert widget.dataValue() == (10, 2)
+
+
+def test_TupleGroupBox_initUI_override(qtbot):
+    class VerticalTupleGroupBox(TupleGroupBox):
+        def initUI(self):
+            layout = QVBoxLayout()
+            for widget in self.widgets():
+                layout.addWidget(widget)
+            self.setLayout(layout)
+
+    widget = VerticalTupleGroupBox.fromWidgets([IntLineEdit(), IntLineEdit()])
+    assert isinstance(widget.layout(), QVBoxLayout)
+    widget.setDataValue((1, 2))
+    with qtbot.waitSignal(
+        widget.dataValueChanged,
+        raising=True,
+        check_params_cb=lambda val: val == (3, 2),
+    ):
+        widget.widgets()[0].setDataValue(3)
+
+
 def test_EnumComboBox(qtbot):
     class MyEnum(Enum):
         x = 1
@@ -297,6 +514,56 @@ def test_EnumComboBox(qtbot):
     with qtbot.assertNotEmitted(widget.dataValueChanged):
         widget.setCurrentIndex(-1)
 
+    # item added after construction
+    class OtherEnum(Enum):
+        w = 0
+
+    widget.addItem("w", userData=OtherEnum.w)
+    with qtbot.waitSignal(
+        widget.dataValueChanged,
+        raising=True,
+        check_params_cb=lambda val: val == OtherEnum.w,
+    ):
+        widget.setDataValue(OtherEnum.w)
+    assert widget.dataValue() == OtherEnum.w
+    assert EnumComboBox.fromEnum(MyEnum).dataValue() == MyEnum.x
+
+
+def test_EnumComboBox_items_changed(qtbot):
+    class MyEnum(Enum):
+        x = 1
+        y = 2
+        z = 3
+
+    widget = EnumComboBox.fromEnum(MyEnum)
+    widget.insertItem(0, "z", userData=MyEnum.z)
+    widget.setCurrentIndex(0)
+    assert widget.currentText() == "z"
+    assert widget.dataValue() == MyEnum.z
+
+    widget.setDataValue(MyEnum.x)
+    assert widget.currentText() == "x"
+    assert widget.dataValue() == MyEnum.x
+
+    widget.removeItem(0)
+    widget.removeItem(0)
+    widget.setDataValue(MyEnum.y)
+    assert widget.currentText() == "y"
+    assert widget.dataValue() == MyEnum.y
+
+
+def test_EnumComboBox_enum_not_retained(qtbot):
+    class MyEnum(Enum):
+        x = 1
+
+    widget = EnumComboBox.fromEnum(MyEnum)
+    ref = weakref.ref(MyEnum)
+    widget.deleteLater()
+    del widget, MyEnum
+    qtbot.wait(10)
+    gc.collect()
+    assert ref() is None
+
 
 def test_IntEnum(qtbot):
     class MyIntEnum(IntEnum):